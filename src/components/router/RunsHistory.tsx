@@ -33,8 +33,10 @@ export const RunsHistory = () => {
 
   const handleViewDetails = async (runId: string) => {
     try {
-      const run = await routerApi.getRun(runId);
-      const logs = await routerApi.getRunLogs(runId);
+      const [run, logs] = await Promise.all([
+        routerApi.getRun(runId),
+        routerApi.getRunLogs(runId),
+      ]);
       
       toast({
         title: `Run ${runId}`,
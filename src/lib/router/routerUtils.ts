@@ -34,8 +34,7 @@ export function formatDuration(ms?: number): string {
  */
 export function formatRelativeTime(timestamp: string): string {
   const date = new Date(timestamp);
-  const now = new Date();
-  const diffMs = now.getTime() - date.getTime();
+  const diffMs = Date.now() - date.getTime();
   
   const seconds = Math.floor(diffMs / 1000);
   const minutes = Math.floor(seconds / 60);